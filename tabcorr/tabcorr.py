@@ -1,4 +1,5 @@
 import itertools
+from concurrent.futures import ProcessPoolExecutor
 import h5py
 import numpy as np
 from scipy.spatial import Delaunay
@@ -6,9 +7,7 @@ from astropy.table import Table, vstack
 from halotools.empirical_models import HodModelFactory, model_defaults
 from halotools.empirical_models import TrivialPhaseSpace, Zheng07Cens
 from halotools.empirical_models import NFWPhaseSpace, Zheng07Sats
-from halotools.mock_observables import return_xyz_formatted_array
 from halotools.sim_manager import sim_defaults
-from halotools.utils import crossmatch
 from halotools.utils.table_utils import compute_conditional_percentiles
 
 
@@ -37,7 +36,7 @@ class TabCorr:
                  sats_per_prim_haloprop=3e-12, downsample=1.0,
                  verbose=False, redshift_space_distortions=True,
                  cens_prof_model=None, sats_prof_model=None, project_xyz=False,
-                 cosmology_ref=None, **tpcf_kwargs):
+                 cosmology_ref=None, num_processes=1, **tpcf_kwargs):
         """
         Tabulates correlation functions for halos such that galaxy correlation
         functions can be calculated rapidly.
@@ -135,6 +134,13 @@ class TabCorr:
             If True, the coordinates will be projected along all three spatial
             axes. By default, only the projection onto the z-axis is used.
 
+        num_processes : int, optional
+            Number of processes used to tabulate the correlation functions of
+            different bins in parallel. If larger than 1, the ``tpcf`` function
+            must be picklable. If ``tpcf`` is parallelized itself, e.g. via the
+            ``num_threads`` argument of halotools, the number of threads per
+            process should be reduced accordingly.
+
         **tpcf_kwargs : dict, optional
                 Keyword arguments passed to the ``tpcf`` function.
 
@@ -176,10 +182,16 @@ class TabCorr:
         halos = halos[halos['halo_pid'] == -1]
         halos = halos[halos[prim_haloprop_key] >= Num_ptcl_requirement *
                       halocat.particle_mass]
-        halos[sec_haloprop_key + '_percentile'] = (
-            compute_conditional_percentiles(
-                table=halos, prim_haloprop_key=prim_haloprop_key,
-                sec_haloprop_key=sec_haloprop_key))
+        # Conditional percentiles lie in (0, 1]. Without a binning in the
+        # secondary halo property, all halos fall into the same bin and the
+        # sorting of halos in each primary bin can be skipped.
+        if np.array_equal(sec_haloprop_percentile_bins, [0, 1]):
+            halos[sec_haloprop_key + '_percentile'] = np.ones(len(halos))
+        else:
+            halos[sec_haloprop_key + '_percentile'] = (
+                compute_conditional_percentiles(
+                    table=halos, prim_haloprop_key=prim_haloprop_key,
+                    sec_haloprop_key=sec_haloprop_key))
 
         halotab.gal_type = Table()
 
@@ -201,11 +213,10 @@ class TabCorr:
             grid[1][1:, :-1].ravel())
 
         halotab.gal_type = vstack([halotab.gal_type, halotab.gal_type])
-        halotab.gal_type['gal_type'] = np.concatenate((
-            np.repeat('centrals'.encode('utf8'),
-                      len(halotab.gal_type) // 2),
-            np.repeat('satellites'.encode('utf8'),
-                      len(halotab.gal_type) // 2)))
+        gal_type = np.empty(len(halotab.gal_type), dtype='S10')
+        gal_type[:len(gal_type) // 2] = 'centrals'.encode('utf8')
+        gal_type[len(gal_type) // 2:] = 'satellites'.encode('utf8')
+        halotab.gal_type['gal_type'] = gal_type
         halotab.gal_type['prim_haloprop'] = 10**(0.5 * (
             halotab.gal_type['log_prim_haloprop_min'] +
             halotab.gal_type['log_prim_haloprop_max']))
@@ -234,9 +245,18 @@ class TabCorr:
         model.param_dict['logM1'] = - np.log10(sats_per_prim_haloprop)
         model.populate_mock(halocat, Num_ptcl_requirement=Num_ptcl_requirement)
         gals = model.mock.galaxy_table
-        gals = gals[np.random.random(len(gals)) < downsample]
-
-        idx_gals, idx_halos = crossmatch(gals['halo_id'], halos['halo_id'])
+        if downsample < 1:
+            gals = gals[np.random.random(len(gals)) < downsample]
+
+        # Halo IDs are unique after selecting host halos. Thus, galaxies can be
+        # matched to halos via a binary search in the sorted halo IDs.
+        halo_order = np.argsort(halos['halo_id'].data)
+        halo_id_sorted = halos['halo_id'].data[halo_order]
+        idx = np.searchsorted(halo_id_sorted, gals['halo_id'].data)
+        idx = np.minimum(idx, len(halo_id_sorted) - 1)
+        idx_gals = np.flatnonzero(
+            halo_id_sorted[idx] == gals['halo_id'].data)
+        idx_halos = halo_order[idx[idx_gals]]
         assert np.all(gals['halo_id'][idx_gals] == halos['halo_id'][idx_halos])
         gals[sec_haloprop_key + '_percentile'] = np.zeros(len(gals))
         gals[sec_haloprop_key + '_percentile'][idx_gals] = (
@@ -245,92 +265,130 @@ class TabCorr:
         if verbose:
             print("Number of tracer particles: {0}".format(len(gals)))
 
+        # Assign each galaxy to its entry in halotab.gal_type. The index
+        # follows the ordering of the table: primary bins vary fastest, then
+        # secondary bins and finally the galaxy type. Galaxies outside of all
+        # bins are given the index len(halotab.gal_type). Bins are open on the
+        # left and closed on the right.
+        n_prim = len(log_prim_haloprop_bins) - 1
+        n_sec = len(sec_haloprop_percentile_bins) - 1
+
+        # First, galaxies are assigned a code on a grid that is extended by
+        # one bin on either side in the primary and secondary properties. The
+        # code is built in place, avoiding temporary arrays.
+        code = np.digitize(gals[sec_haloprop_key + '_percentile'].data,
+                           sec_haloprop_percentile_bins, right=True)
+        code += (n_sec + 2) * (gals['gal_type'].data == 'satellites')
+        code *= n_prim + 2
+        code += np.digitize(gals[prim_haloprop_key].data,
+                            10**log_prim_haloprop_bins, right=True)
+
+        # A lookup table then maps the code to the index in halotab.gal_type
+        # without any branching. For the typical number of bins, the index
+        # fits into 16 bits, in which case numpy uses a radix sort that scales
+        # linearly with the number of galaxies. A stable sort keeps the
+        # original order of galaxies within each bin.
+        lookup = np.full((2, n_sec + 2, n_prim + 2), len(halotab.gal_type),
+                         dtype=np.min_scalar_type(len(halotab.gal_type)))
+        lookup[:, 1:-1, 1:-1] = np.arange(len(halotab.gal_type)).reshape(
+            2, n_sec, n_prim)
+        gal_type_index = lookup.ravel()[code]
+        order = np.argsort(gal_type_index, kind='stable')
+        n_gals = np.bincount(gal_type_index, minlength=len(
+            halotab.gal_type) + 1)[:len(halotab.gal_type)]
+        offsets = np.append(0, np.cumsum(n_gals))
+
+        # Displacement along the line of sight per unit peculiar velocity.
+        rsd_factor = ((1.0 + halocat.redshift) / 100.0 /
+                      cosmology.efunc(halocat.redshift))
+
         for xyz in ['xyz', 'yzx', 'zxy']:
-            pos_all = return_xyz_formatted_array(
-                x=gals[xyz[0]], y=gals[xyz[1]], z=gals[xyz[2]],
-                velocity=gals['v'+xyz[2]] if redshift_space_distortions else 0,
-                velocity_distortion_dimension='z', period=halocat.Lbox,
-                redshift=halocat.redshift, cosmology=cosmology) * lbox_stretch
-
-            pos = []
-            n_gals = []
-            for i in range(len(halotab.gal_type)):
-
-                mask = (
-                    (10**(halotab.gal_type['log_prim_haloprop_min'][i]) <
-                     gals[prim_haloprop_key]) &
-                    (10**(halotab.gal_type['log_prim_haloprop_max'][i]) >=
-                     gals[prim_haloprop_key]) &
-                    (halotab.gal_type['sec_haloprop_percentile_min'][i] <
-                     gals[sec_haloprop_key + '_percentile']) &
-                    (halotab.gal_type['sec_haloprop_percentile_max'][i] >=
-                     gals[sec_haloprop_key + '_percentile']) &
-                    (halotab.gal_type['gal_type'][i] == gals['gal_type']))
-
-                pos.append(pos_all[mask])
-                n_gals.append(np.sum(mask))
-
-            n_gals = np.array(n_gals)
+            # The positions are written directly in the sorted order into a
+            # single contiguous array. The last axis is the line of sight.
+            pos_all = np.empty((len(gals), 3))
+            for dim in range(3):
+                pos_all[:, dim] = gals[xyz[dim]].data[order]
+            np.mod(pos_all, halocat.Lbox, out=pos_all)
+            if redshift_space_distortions:
+                pos_all[:, 2] += gals['v' + xyz[2]].data[order] * rsd_factor
+                pos_all[:, 2] = np.mod(pos_all[:, 2], halocat.Lbox[2])
+            pos_all *= lbox_stretch
+
+            pos = [pos_all[offsets[i]:offsets[i+1]] for i in
+                   range(len(halotab.gal_type))]
             n_done = 0
 
             if verbose:
                 print("Projecting onto {0}-axis...".format(xyz[2]))
 
-            for i in range(len(halotab.gal_type)):
-
-                if mode == 'auto':
-                    for k in range(i, len(halotab.gal_type)):
-                        if len(pos[i]) * len(pos[k]) > 0:
-
-                            if verbose:
-                                n_done += (n_gals[i] * n_gals[k] * (
-                                    2 if k != i else 1))
-                                print_progress(n_done / np.sum(n_gals)**2)
-
-                            xi = tpcf(
-                                pos[i], *tpcf_args,
-                                sample2=pos[k] if k != i else None,
-                                do_auto=(i == k), do_cross=(not i == k),
-                                period=halocat.Lbox * lbox_stretch,
-                                **tpcf_kwargs)
-                            if 'tpcf_matrix' not in locals():
-                                tpcf_matrix = np.zeros(
-                                    (len(xi.ravel()), len(halotab.gal_type),
-                                     len(halotab.gal_type)))
-                                tpcf_shape = xi.shape
-                            tpcf_matrix[:, i, k] += xi.ravel()
-                            tpcf_matrix[:, k, i] = tpcf_matrix[:, i, k]
-
-                elif mode == 'cross':
-                    if len(pos[i]) > 0:
-
-                        if verbose:
+            # Only bins containing galaxies contribute to the correlation
+            # functions, so all other bins are skipped.
+            nonempty = np.flatnonzero(n_gals > 0).tolist()
+
+            # Each row contains the bins paired with bin i. Rows are
+            # independent of each other and can be computed in parallel.
+            if mode == 'auto':
+                rows = [(i, [k for k in nonempty if k >= i]) for i in
+                        nonempty]
+            elif mode == 'cross':
+                rows = [(i, [i]) for i in nonempty]
+
+            row_kwargs = dict(mode=mode, period=halocat.Lbox * lbox_stretch,
+                              tpcf_args=tpcf_args, tpcf_kwargs=tpcf_kwargs)
+            if num_processes > 1:
+                executor = ProcessPoolExecutor(
+                    max_workers=num_processes,
+                    initializer=_initialize_row_worker,
+                    initargs=(tpcf, pos, row_kwargs))
+                xi_rows = executor.map(_tabulate_row_worker, *zip(*rows))
+            else:
+                executor = None
+                xi_rows = (tabulate_row(tpcf, pos, i, k_list, **row_kwargs)
+                           for i, k_list in rows)
+
+            for (i, k_list), xi_row in zip(rows, xi_rows):
+                for k, xi in zip(k_list, xi_row):
+
+                    if verbose:
+                        if mode == 'auto':
+                            n_done += (n_gals[i] * n_gals[k] * (
+                                2 if k != i else 1))
+                            print_progress(n_done / np.sum(n_gals)**2)
+                        elif mode == 'cross':
                             n_done += n_gals[i]
                             print_progress(n_done / np.sum(n_gals))
 
-                        xi = tpcf(
-                            pos[i], *tpcf_args, **tpcf_kwargs,
-                            period=halocat.Lbox * lbox_stretch)
-                        if tpcf.__name__ == 'delta_sigma':
-                            xi = xi[1]
-                        if 'tpcf_matrix' not in locals():
+                    if 'tpcf_matrix' not in locals():
+                        if mode == 'auto':
+                            tpcf_matrix = np.zeros(
+                                (len(xi.ravel()), len(halotab.gal_type),
+                                 len(halotab.gal_type)))
+                        elif mode == 'cross':
                             tpcf_matrix = np.zeros(
                                 (len(xi.ravel()), len(halotab.gal_type)))
-                            tpcf_shape = xi.shape
+                        tpcf_shape = xi.shape
+
+                    if mode == 'auto':
+                        tpcf_matrix[:, i, k] += xi.ravel()
+                        tpcf_matrix[:, k, i] = tpcf_matrix[:, i, k]
+                    elif mode == 'cross':
                         tpcf_matrix[:, i] = xi.ravel()
 
+            if executor is not None:
+                executor.shutdown()
+
             if not project_xyz or mode == 'cross':
                 break
 
         if project_xyz and mode == 'auto':
             tpcf_matrix /= 3.0
 
+        # For auto-correlations, only the lower triangle of the symmetric
+        # matrix is stored. The result has shape (n_r, N * (N + 1) / 2) and
+        # is C-contiguous such that predict reduces along contiguous rows.
         if mode == 'auto':
-            tpcf_matrix_flat = []
-            for i in range(tpcf_matrix.shape[0]):
-                tpcf_matrix_flat.append(symmetric_matrix_to_array(
-                    tpcf_matrix[i]))
-            tpcf_matrix = np.array(tpcf_matrix_flat)
+            i, k = np.tril_indices(len(halotab.gal_type))
+            tpcf_matrix = np.ascontiguousarray(tpcf_matrix[:, i, k])
 
         halotab.attrs = {}
         halotab.attrs['tpcf'] = tpcf.__name__
@@ -346,6 +404,8 @@ class TabCorr:
         halotab.tpcf_shape = tpcf_shape
         halotab.tpcf_matrix = tpcf_matrix
 
+        halotab.prepare_predict()
+
         halotab.init = True
 
         return halotab
@@ -369,26 +429,27 @@ class TabCorr:
 
         halotab = cls()
 
-        fstream = h5py.File(fname, 'r')
-        halotab.attrs = {}
-        for key in fstream.attrs.keys():
-            halotab.attrs[key] = fstream.attrs[key]
-
-        halotab.tpcf_matrix = fstream['tpcf_matrix'][()]
-
-        halotab.tpcf_args = []
-        for key in fstream['tpcf_args'].keys():
-            halotab.tpcf_args.append(fstream['tpcf_args'][key][()])
-        halotab.tpcf_args = tuple(halotab.tpcf_args)
-        halotab.tpcf_kwargs = {}
-        if 'tpcf_kwargs' in fstream:
-            for key in fstream['tpcf_kwargs'].keys():
-                halotab.tpcf_kwargs[key] = fstream['tpcf_kwargs'][key][()]
-        halotab.tpcf_shape = tuple(fstream['tpcf_shape'][()])
-        fstream.close()
+        with h5py.File(fname, 'r') as fstream:
+            halotab.attrs = {}
+            for key in fstream.attrs.keys():
+                halotab.attrs[key] = fstream.attrs[key]
+
+            halotab.tpcf_matrix = fstream['tpcf_matrix'][()]
+
+            halotab.tpcf_args = []
+            for key in fstream['tpcf_args'].keys():
+                halotab.tpcf_args.append(fstream['tpcf_args'][key][()])
+            halotab.tpcf_args = tuple(halotab.tpcf_args)
+            halotab.tpcf_kwargs = {}
+            if 'tpcf_kwargs' in fstream:
+                for key in fstream['tpcf_kwargs'].keys():
+                    halotab.tpcf_kwargs[key] = fstream['tpcf_kwargs'][key][()]
+            halotab.tpcf_shape = tuple(fstream['tpcf_shape'][()])
 
         halotab.gal_type = Table.read(fname, path='gal_type')
 
+        halotab.prepare_predict()
+
         halotab.init = True
 
         return halotab
@@ -410,6 +471,10 @@ class TabCorr:
             TabCorr write arguments passed to the correlation function to file.
             However, arguments that are numpy array with more entries than
             max_args_size will be omitted.
+
+        matrix_dtype : type, optional
+            Data type used to store the tabulated correlation functions. By
+            default, they are stored in single precision.
         """
 
         fstream = h5py.File(fname, 'w' if overwrite else 'w-')
@@ -419,7 +484,16 @@ class TabCorr:
         for key in keys:
             fstream.attrs[key] = self.attrs[key]
 
-        fstream['tpcf_matrix'] = self.tpcf_matrix.astype(matrix_dtype)
+        # Byte shuffling followed by LZF compression substantially reduces the
+        # file size at little cost when reading and writing. The matrix is
+        # converted and written one separation bin at a time such that no
+        # full copy of the matrix is created.
+        dset = fstream.create_dataset(
+            'tpcf_matrix', shape=self.tpcf_matrix.shape, dtype=matrix_dtype,
+            chunks=(1, ) + self.tpcf_matrix.shape[1:], compression='lzf',
+            shuffle=True)
+        for i in range(self.tpcf_matrix.shape[0]):
+            dset[i] = self.tpcf_matrix[i]
 
         for i, arg in enumerate(self.tpcf_args):
             if (type(arg) is not np.ndarray or
@@ -434,6 +508,45 @@ class TabCorr:
 
         self.gal_type.write(fname, path='gal_type', append=True)
 
+    def prepare_predict(self):
+        """
+        Precomputes quantities needed by predict. This is called by tabulate
+        and read and only needs to be called again if the tabulated
+        correlation functions are modified afterwards.
+        """
+
+        # Accessing columns of astropy tables is slow compared to numpy arrays.
+        # Thus, the halo properties of centrals and satellites are extracted
+        # once.
+        self._centrals = np.asarray(self.gal_type['gal_type'] == 'centrals')
+        self._n_h = np.array(self.gal_type['n_h'])
+        self._haloprop = {}
+        for gal_type, mask in zip(['centrals', 'satellites'],
+                                  [self._centrals, ~self._centrals]):
+            self._haloprop[gal_type] = dict(
+                prim_haloprop=np.array(self.gal_type['prim_haloprop'][mask]),
+                sec_haloprop_percentile=np.array(
+                    self.gal_type['sec_haloprop_percentile'][mask]))
+
+        # Tabulated correlation functions vanish for bins without galaxies.
+        # These bins do not contribute to the correlation function and are
+        # skipped in the contraction in predict.
+        self._nonzero = np.flatnonzero(np.any(self.tpcf_matrix != 0, axis=0))
+        if len(self._nonzero) == self.tpcf_matrix.shape[1]:
+            self._tpcf_matrix_nonzero = self.tpcf_matrix
+        else:
+            self._tpcf_matrix_nonzero = np.ascontiguousarray(
+                self.tpcf_matrix[:, self._nonzero])
+
+        # For auto-correlations, each column corresponds to a pair of bins in
+        # the lower triangle of the symmetric matrix. Pairs of different bins
+        # are counted twice.
+        if self.attrs['mode'] == 'auto':
+            i, k = np.tril_indices(len(self.gal_type))
+            self._pair_i = i[self._nonzero]
+            self._pair_k = k[self._nonzero]
+            self._pair_factor = np.where(self._pair_i == self._pair_k, 1, 2)
+
     def predict(self, model, separate_gal_type=False, **occ_kwargs):
         """
         Predicts the number density and correlation function for a certain
@@ -503,29 +616,33 @@ class TabCorr:
 
         mean_occupation = np.zeros(len(self.gal_type))
 
-        mask = self.gal_type['gal_type'] == 'centrals'
+        mask = self._centrals
         mean_occupation[mask] = model.mean_occupation_centrals(
-            prim_haloprop=self.gal_type['prim_haloprop'][mask],
-            sec_haloprop_percentile=(
-                self.gal_type['sec_haloprop_percentile'][mask]), **occ_kwargs)
+            **self._haloprop['centrals'], **occ_kwargs)
         mean_occupation[~mask] = model.mean_occupation_satellites(
-            prim_haloprop=self.gal_type['prim_haloprop'][~mask],
-            sec_haloprop_percentile=(
-                self.gal_type['sec_haloprop_percentile'][~mask]), **occ_kwargs)
+            **self._haloprop['satellites'], **occ_kwargs)
 
-        ngal = mean_occupation * self.gal_type['n_h'].data
+        ngal = mean_occupation * self._n_h
 
+        # Weights are only calculated for the columns of tpcf_matrix that do
+        # not vanish. The sum of the weights over all pairs of bins is the
+        # square of the total number density.
         if self.attrs['mode'] == 'auto':
-            ngal_sq = np.outer(ngal, ngal)
-            ngal_sq = 2 * ngal_sq - np.diag(np.diag(ngal_sq))
-            ngal_sq = symmetric_matrix_to_array(ngal_sq)
-            xi = self.tpcf_matrix * ngal_sq / np.sum(ngal_sq)
+            weights = (ngal[self._pair_i] * ngal[self._pair_k] *
+                       self._pair_factor / np.sum(ngal)**2)
         elif self.attrs['mode'] == 'cross':
-            xi = self.tpcf_matrix * ngal / np.sum(ngal)
+            weights = ngal[self._nonzero] / np.sum(ngal)
+
+        # The correlation function is a weighted sum over the tabulated
+        # correlation functions, i.e. a single matrix-vector product. It is
+        # done in the precision of tpcf_matrix, e.g. single precision after
+        # reading from disk, such that the matrix is never converted.
+        weights = weights.astype(self.tpcf_matrix.dtype)
 
         if not separate_gal_type:
             ngal = np.sum(ngal)
-            xi = np.sum(xi, axis=1).reshape(self.tpcf_shape)
+            xi = np.dot(self._tpcf_matrix_nonzero, weights).astype(
+                np.float64).reshape(self.tpcf_shape)
             return ngal, xi
         else:
             ngal_dict = {}
@@ -545,14 +662,18 @@ class TabCorr:
                             np.outer(
                         gal_type_2 == self.gal_type['gal_type'],
                         gal_type_1 == self.gal_type['gal_type']))
-                    xi_dict['%s-%s' % (gal_type_1, gal_type_2)] = np.sum(
-                        xi * mask, axis=1).reshape(self.tpcf_shape)
+                    xi_dict['%s-%s' % (gal_type_1, gal_type_2)] = np.dot(
+                        self._tpcf_matrix_nonzero,
+                        weights * mask[self._nonzero]).astype(
+                            np.float64).reshape(self.tpcf_shape)
 
             elif self.attrs['mode'] == 'cross':
                 for gal_type in np.unique(self.gal_type['gal_type']):
                     mask = self.gal_type['gal_type'] == gal_type
-                    xi_dict[gal_type] = np.sum(
-                        xi * mask, axis=1).reshape(self.tpcf_shape)
+                    xi_dict[gal_type] = np.dot(
+                        self._tpcf_matrix_nonzero,
+                        weights * mask[self._nonzero]).astype(
+                            np.float64).reshape(self.tpcf_shape)
 
             return ngal_dict, xi_dict
 
@@ -692,6 +813,47 @@ class TabCorrInterpolation:
         return ngal, xi
 
 
+def tabulate_row(tpcf, pos, i, k_list, mode, period, tpcf_args,
+                 tpcf_kwargs):
+    """
+    Calculates the correlation functions of bin i with all bins in k_list.
+    For cross-correlations, k_list is ignored and only the correlation
+    function of bin i is returned.
+    """
+
+    xi_row = []
+
+    if mode == 'auto':
+        for k in k_list:
+            xi_row.append(tpcf(
+                pos[i], *tpcf_args, sample2=pos[k] if k != i else None,
+                do_auto=(i == k), do_cross=(not i == k), period=period,
+                **tpcf_kwargs))
+
+    elif mode == 'cross':
+        xi = tpcf(pos[i], *tpcf_args, **tpcf_kwargs, period=period)
+        if tpcf.__name__ == 'delta_sigma':
+            xi = xi[1]
+        xi_row.append(xi)
+
+    return xi_row
+
+
+_row_worker_data = {}
+
+
+def _initialize_row_worker(tpcf, pos, row_kwargs):
+    # The positions are sent to each worker process only once.
+    _row_worker_data['tpcf'] = tpcf
+    _row_worker_data['pos'] = pos
+    _row_worker_data['row_kwargs'] = row_kwargs
+
+
+def _tabulate_row_worker(i, k_list):
+    return tabulate_row(_row_worker_data['tpcf'], _row_worker_data['pos'], i,
+                        k_list, **_row_worker_data['row_kwargs'])
+
+
 def symmetric_matrix_to_array(matrix):
 
     try: